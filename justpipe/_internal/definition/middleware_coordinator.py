@@ -38,10 +38,12 @@ class _MiddlewareCoordinator:
     def apply_middleware(self, steps: dict[str, _BaseStep]) -> None:
         """Apply middleware to all steps that are stale for current middleware version."""
         current_version = self._middleware_version
+        # One immutable snapshot shared by every step wrap in this pass.
+        middleware_snapshot = tuple(self.middleware)
         for name, step in steps.items():
             wrapped_version = self._step_wrap_version.get(name)
             if step._wrapped_func is None or wrapped_version != current_version:
-                step.wrap_middleware(self.middleware)
+                step.wrap_middleware(middleware_snapshot)
                 self._step_wrap_version[name] = current_version
 
         # Drop metadata for removed steps.
@@ -57,6 +57,9 @@ class _StepRegistry:
         self.injection_metadata: InjectionMetadataMap = {}
         self._pending_validations: list[dict[str, Any]] = []
         self._frozen = False
+        # Memoized StepInfo records; a step's targets and configuration are
+        # fixed at registration, so the derived record never changes.
+        self._step_info_cache: dict[str, StepInfo] = {}
 
     def freeze(self) -> None:
         self._frozen = True
@@ -67,16 +70,27 @@ class _StepRegistry:
                 f"Pipeline definition is frozen after first run; cannot {action}."
             )
 
-    def _pop_common_step_kwargs(
+    def _split_common_step_kwargs(
         self, kwargs: dict[str, Any]
-    ) -> tuple[float | None, int | dict[str, Any]]:
-        timeout = kwargs.pop("timeout", None)
-        retries = kwargs.pop("retries", 0)
-        return timeout, retries
+    ) -> tuple[float | None, int | dict[str, Any], dict[str, Any]]:
+        """Split timeout/retries from kwargs, building the extras dict once."""
+        timeout = kwargs.get("timeout")
+        retries = kwargs.get("retries", 0)
+        extra = {k: v for k, v in kwargs.items() if k not in ("timeout", "retries")}
+        return timeout, retries, extra
 
     def _normalize_linear_targets(self, to: LinearTo) -> list[str] | None:
         if not to:
             return None
+        # Fast-path the common string / list-of-strings cases; _resolve_name
+        # on a string is the identity. The comprehension also narrows the
+        # element type for the checker, which all(isinstance(...)) cannot.
+        if isinstance(to, str):
+            return [to]
+        if isinstance(to, list):
+            strs = [t for t in to if isinstance(t, str)]
+            if len(strs) == len(to):
+                return strs
         return [_resolve_name(t) for t in (to if isinstance(to, list) else [to])]
 
     def _build_linear_decorator(
@@ -95,8 +109,7 @@ class _StepRegistry:
                 pre_validate(stage_name)
             self._validator.validate_linear_to(stage_name, to)
 
-            step_kwargs = kwargs.copy()
-            timeout, retries = self._pop_common_step_kwargs(step_kwargs)
+            timeout, retries, step_kwargs = self._split_common_step_kwargs(kwargs)
             normalized_to = self._normalize_linear_targets(to)
 
             step_obj = build_step(
@@ -233,12 +246,16 @@ class _StepRegistry:
                     f"Step '{stage_name}' (map) requires 'each' parameter"
                 )
 
-            self._validator.validate_routing_target_type(each, stage_name)
-            target_name = _resolve_name(each)
+            # A plain string target is trivially valid; skip the validator
+            # dispatch and identity resolution on the common path.
+            if isinstance(each, str):
+                target_name = each
+            else:
+                self._validator.validate_routing_target_type(each, stage_name)
+                target_name = _resolve_name(each)
             self._validator.validate_linear_to(stage_name, to)
 
-            map_kwargs = kwargs.copy()
-            timeout, retries = self._pop_common_step_kwargs(map_kwargs)
+            timeout, retries, map_kwargs = self._split_common_step_kwargs(kwargs)
             normalized_to = self._normalize_linear_targets(to)
 
             step_obj = _MapStep(
@@ -292,7 +309,7 @@ class _StepRegistry:
                 )
 
             self._validator.validate_routing_target_type(to, stage_name)
-            if default:
+            if default and not isinstance(default, str):
                 self._validator.validate_routing_target_type(default, stage_name)
 
             normalized_routes = {}
@@ -302,14 +319,16 @@ class _StepRegistry:
                         Stop if target is Stop else _resolve_name(target)
                     )
 
-            switch_kwargs = kwargs.copy()
-            timeout, retries = self._pop_common_step_kwargs(switch_kwargs)
+            # Resolve once; reused for the step default and the route targets.
+            resolved_default = _resolve_name(default) if default else None
+
+            timeout, retries, switch_kwargs = self._split_common_step_kwargs(kwargs)
 
             step_obj = _SwitchStep(
                 name=stage_name,
                 func=func,
                 to=normalized_routes if isinstance(to, dict) else to,
-                default=_resolve_name(default) if default else None,
+                default=resolved_default,
                 timeout=timeout,
                 retries=retries,
                 barrier_timeout=barrier_timeout,
@@ -321,8 +340,8 @@ class _StepRegistry:
 
             if isinstance(to, dict):
                 targets = {t for t in normalized_routes.values() if t is not Stop}
-                if default:
-                    targets.add(_resolve_name(default))
+                if resolved_default:
+                    targets.add(resolved_default)
 
                 self._pending_validations.append(
                     {
@@ -396,26 +415,41 @@ class _StepRegistry:
     def get_steps_info(self) -> Iterator[StepInfo]:
         """Iterate over registered steps with their configuration."""
         for name, step in self.steps.items():
-            targets = list(self.topology.get(name, []))
-            targets.extend(step.get_targets())
-
-            unique_targets = sorted(set(targets))
-
-            sub_hash: str | None = None
             if isinstance(step, _SubPipelineStep):
-                sub_hash = compute_pipeline_hash(
-                    step.pipeline.registry.pipe_name,
-                    step.pipeline.registry.steps,
-                    step.pipeline.registry.topology,
-                )
-
-            yield StepInfo(
-                name=name,
-                timeout=step.timeout,
-                retries=step.retries,
-                barrier_timeout=step.barrier_timeout,
-                has_error_handler=step.on_error is not None,
-                targets=unique_targets,
-                kind=step.get_kind(),
-                sub_pipeline_hash=sub_hash,
+                # The hash reflects the sub-pipeline's current definition,
+                # which may still change; rebuild instead of caching.
+                yield self._build_step_info(name, step)
+                continue
+
+            info = self._step_info_cache.get(name)
+            if info is None:
+                info = self._build_step_info(name, step)
+                self._step_info_cache[name] = info
+            yield info
+
+    def _build_step_info(self, name: str, step: _BaseStep) -> StepInfo:
+        targets = list(self.topology.get(name, []))
+        targets.extend(step.get_targets())
+
+        # Tuple, not list: cached records are aliased across steps() calls
+        # and must stay immutable all the way down.
+        unique_targets = tuple(sorted(set(targets)))
+
+        sub_hash: str | None = None
+        if isinstance(step, _SubPipelineStep):
+            sub_hash = compute_pipeline_hash(
+                step.pipeline.registry.pipe_name,
+                step.pipeline.registry.steps,
+                step.pipeline.registry.topology,
             )
+
+        return StepInfo(
+            name=name,
+            timeout=step.timeout,
+            retries=step.retries,
+            barrier_timeout=step.barrier_timeout,
+            has_error_handler=step.on_error is not None,
+            targets=unique_targets,
+            kind=step.get_kind(),
+            sub_pipeline_hash=sub_hash,
+        )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from typing import Any, TYPE_CHECKING
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 import inspect
 
 from justpipe.types import (
@@ -22,6 +22,21 @@ if TYPE_CHECKING:
 class _BaseStep(ABC):
     """Abstract base class for all pipeline steps."""
 
+    __slots__ = (
+        "name",
+        "_original_func",
+        "timeout",
+        "retries",
+        "barrier_timeout",
+        "barrier_type",
+        "on_error",
+        "pipe_name",
+        "extra",
+        "_wrapped_func",
+        "_is_coro_func",
+        "_is_asyncgen_func",
+    )
+
     def __init__(
         self,
         name: str,
@@ -45,13 +60,17 @@ class _BaseStep(ABC):
         self.extra = extra or {}
 
         self._wrapped_func: Callable[..., Any] | None = None
+        # Cached once per (re)wrap; inspect.iscoroutinefunction walks
+        # __wrapped__ chains and is pure overhead on repeated invocation.
+        self._is_coro_func = inspect.iscoroutinefunction(func)
+        self._is_asyncgen_func = inspect.isasyncgenfunction(func)
 
     @property
     def _active_func(self) -> Callable[..., Any]:
         """Return the wrapped function if middleware was applied, otherwise the original."""
         return self._wrapped_func or self._original_func
 
-    def wrap_middleware(self, middleware: list["Middleware"]) -> None:
+    def wrap_middleware(self, middleware: Sequence["Middleware"]) -> None:
         """Apply middleware to the step function."""
         wrapped = self._original_func
         ctx = StepContext(
@@ -63,6 +82,8 @@ class _BaseStep(ABC):
         for mw in middleware:
             wrapped = mw(wrapped, ctx)
         self._wrapped_func = wrapped
+        self._is_coro_func = inspect.iscoroutinefunction(wrapped)
+        self._is_asyncgen_func = inspect.isasyncgenfunction(wrapped)
 
     @abstractmethod
     def get_kind(self) -> NodeKind:
@@ -76,12 +97,16 @@ class _BaseStep(ABC):
         """Execute the step logic."""
         res = self._active_func(**kwargs)
 
-        if inspect.isawaitable(res):
+        # Fast path via the cached flag; sync functions returning awaitables
+        # still fall through to the dynamic check.
+        if self._is_coro_func or inspect.isawaitable(res):
             return await res
         return res
 
 
 class _StandardStep(_BaseStep):
+    __slots__ = ("to",)
+
     def __init__(
         self,
         name: str,
@@ -100,6 +125,8 @@ class _StandardStep(_BaseStep):
 
 
 class _MapStep(_BaseStep):
+    __slots__ = ("each", "to", "max_concurrency", "max_map_items")
+
     # Default maximum items to materialize from async generators (safety limit)
     DEFAULT_MAX_ITEMS = 100_000
 
@@ -128,7 +155,7 @@ class _MapStep(_BaseStep):
     async def execute(self, **kwargs: Any) -> Any:
         res = await super().execute(**kwargs)
 
-        if inspect.isasyncgen(res):
+        if self._is_asyncgen_func or inspect.isasyncgen(res):
             # Materialize async generator with safety limit to prevent OOM
             items = []
             async for item in res:
@@ -153,6 +180,8 @@ class _MapStep(_BaseStep):
 
 
 class _SwitchStep(_BaseStep):
+    __slots__ = ("to", "default")
+
     def __init__(
         self,
         name: str,
@@ -222,6 +251,8 @@ class _SwitchStep(_BaseStep):
 
 
 class _SubPipelineStep(_BaseStep):
+    __slots__ = ("pipeline", "to")
+
     def __init__(
         self,
         name: str,
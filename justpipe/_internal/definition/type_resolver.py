@@ -1,3 +1,4 @@
+import functools
 import inspect
 from typing import Any, get_type_hints
 from collections.abc import Callable
@@ -15,6 +16,45 @@ ERROR_ALIASES: frozenset[str] = frozenset({"e", "error", "exception"})
 STEP_NAME_ALIASES: frozenset[str] = frozenset({"step_name", "stage"})
 CANCEL_ALIASES: frozenset[str] = frozenset({"cancel", "cancellation_token"})
 
+# Single-probe alias lookup built once at import; one dict.get replaces up to
+# five sequential frozenset membership checks per parameter.
+_ALIAS_SOURCE: dict[str, InjectionSource] = {
+    **dict.fromkeys(STATE_ALIASES, InjectionSource.STATE),
+    **dict.fromkeys(CONTEXT_ALIASES, InjectionSource.CONTEXT),
+    **dict.fromkeys(ERROR_ALIASES, InjectionSource.ERROR),
+    **dict.fromkeys(STEP_NAME_ALIASES, InjectionSource.STEP_NAME),
+    **dict.fromkeys(CANCEL_ALIASES, InjectionSource.CANCEL),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _params_of(func: Callable[..., Any]) -> tuple[tuple[str, Any], ...]:
+    """Extract injectable ``(name, annotation)`` pairs for a callable.
+
+    Cached because ``inspect.signature`` and ``get_type_hints`` perform
+    expensive reflection on every call, and the same callable is commonly
+    re-analyzed (e.g. a shared error handler referenced by several steps).
+    """
+    try:
+        hints = get_type_hints(func)
+    except (TypeError, NameError):
+        # Fallback for complex types or forward refs that can't be resolved
+        hints = {}
+
+    sig = inspect.signature(func)
+    params: list[tuple[str, Any]] = []
+    for name, param in sig.parameters.items():
+        # Skip *args and **kwargs
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+
+        # Skip parameters with defaults
+        if param.default is not param.empty:
+            continue
+
+        params.append((name, hints.get(name, param.annotation)))
+    return tuple(params)
+
 
 class _TypeResolver:
     """Internal component for analyzing function signatures and resolving injections."""
@@ -40,26 +80,15 @@ class _TypeResolver:
             A dictionary mapping parameter names to their source (state, context, etc.).
         """
         try:
-            hints = get_type_hints(func)
-        except (TypeError, NameError):
-            # Fallback for complex types or forward refs that can't be resolved
-            hints = {}
+            params = _params_of(func)
+        except TypeError:
+            # Unhashable callables can't be cached; analyze them directly.
+            params = _params_of.__wrapped__(func)
 
-        sig = inspect.signature(func)
         mapping: InjectionMetadata = {}
         unknowns = []
 
-        for name, param in sig.parameters.items():
-            # Skip *args and **kwargs
-            if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
-                continue
-
-            # Skip parameters with defaults
-            if param.default is not param.empty:
-                continue
-
-            param_type = hints.get(name, param.annotation)
-
+        for name, param_type in params:
             # 1. Match by type
             if self._is_subclass(param_type, state_type):
                 mapping[name] = InjectionSource.STATE
@@ -70,16 +99,8 @@ class _TypeResolver:
             elif self._is_subclass(param_type, Exception):
                 mapping[name] = InjectionSource.ERROR
             # 2. Match by Name (Fallback)
-            elif name in STATE_ALIASES:
-                mapping[name] = InjectionSource.STATE
-            elif name in CONTEXT_ALIASES:
-                mapping[name] = InjectionSource.CONTEXT
-            elif name in ERROR_ALIASES:
-                mapping[name] = InjectionSource.ERROR
-            elif name in STEP_NAME_ALIASES:
-                mapping[name] = InjectionSource.STEP_NAME
-            elif name in CANCEL_ALIASES:
-                mapping[name] = InjectionSource.CANCEL
+            elif (alias_source := _ALIAS_SOURCE.get(name)) is not None:
+                mapping[name] = alias_source
             # 3. Handle Unknowns (for Map items)
             else:
                 mapping[name] = InjectionSource.UNKNOWN
@@ -77,6 +77,7 @@ def build_runner_deps(
         config.injection_metadata,
         config.on_error,
         config.cancellation_token,
+        batch_tokens=config.queue_size <= 0,
     )
     # Build plan and runtime graph in one pass.
     plan, graph = compile_execution_plan(
@@ -14,6 +14,7 @@ from collections.abc import AsyncGenerator, Awaitable, Callable
 from justpipe._internal.runtime.orchestration.control import (
     InvocationContext,
     RuntimeEvent,
+    RuntimeEventBatch,
     StepCompleted,
 )
 from justpipe._internal.runtime.orchestration.barrier_manager import _BarrierManager
@@ -154,6 +155,12 @@ class _PipelineRunner(Generic[StateT, ContextT]):
             if isinstance(item, RuntimeEvent):
                 async for ev in self._handle_event(item.event):
                     yield ev
+            elif isinstance(item, RuntimeEventBatch):
+                # Expand batched events so consumers keep seeing one event
+                # per token.
+                for event in item.events:
+                    async for ev in self._handle_event(event):
+                        yield ev
             elif isinstance(item, StepCompleted):
                 async for ev in self._handle_result(item):
                     yield ev
@@ -1,5 +1,5 @@
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, TYPE_CHECKING
@@ -46,7 +46,11 @@ class _Scheduler:
         self._failure_handler = failure_handler
         self._steps = steps
         self._injection_metadata = injection_metadata
-        self._map_batches: dict[str, list[_MapBatch]] = defaultdict(list)
+        # Insertion-ordered batches per owner (drives drain/report order)
+        # plus an owner->target index of not-yet-drained batches so worker
+        # completions resolve in O(1) instead of scanning every batch.
+        self._map_batches: dict[str, deque[_MapBatch]] = defaultdict(deque)
+        self._pending_by_target: dict[str, dict[str, deque[_MapBatch]]] = {}
 
     async def sub_pipe_wrapper(
         self,
@@ -111,14 +115,15 @@ class _Scheduler:
         attempt = owner_invocation.attempt if owner_invocation else 1
         scope = owner_invocation.scope if owner_invocation else ()
 
-        self._map_batches[owner].append(
+        self._register_batch(
+            owner,
             _MapBatch(
                 target=res.target,
                 item_count=item_count,
                 remaining=item_count,
                 owner_invocation_id=inv_id,
                 owner_scope=scope,
-            )
+            ),
         )
 
         # Emit MAP_START event
@@ -184,6 +189,13 @@ class _Scheduler:
                 owner,
             )
 
+    def _register_batch(self, owner: str, batch: _MapBatch) -> None:
+        self._map_batches[owner].append(batch)
+        if batch.remaining > 0:
+            self._pending_by_target.setdefault(owner, {}).setdefault(
+                batch.target, deque()
+            ).append(batch)
+
     def on_step_completed(self, owner: str, step_name: str) -> list[_MapBatch]:
         """Resolve any map batches that are now fully drained."""
         completed: list[_MapBatch] = []
@@ -194,21 +206,29 @@ class _Scheduler:
         # Empty maps complete when the map owner step itself completes.
         if step_name == owner:
             while batches and batches[0].remaining == 0:
-                completed.append(batches.pop(0))
+                completed.append(batches.popleft())
             if not batches:
                 self._map_batches.pop(owner, None)
             return completed
 
-        # Worker completion decrements the oldest matching batch.
-        for batch in batches:
-            if batch.target == step_name and batch.remaining > 0:
-                batch.remaining -= 1
-                if batch.remaining == 0:
-                    completed.append(batch)
-                break
+        # Worker completion decrements the oldest pending batch for that
+        # target; the index only holds batches with remaining > 0, so the
+        # front of the deque is always the one to decrement.
+        by_target = self._pending_by_target.get(owner)
+        pending = by_target.get(step_name) if by_target else None
+        if pending:
+            batch = pending[0]
+            batch.remaining -= 1
+            if batch.remaining == 0:
+                completed.append(batch)
+                pending.popleft()
+                if not pending and by_target is not None:
+                    del by_target[step_name]
+                    if not by_target:
+                        self._pending_by_target.pop(owner, None)
 
         while batches and batches[0].remaining == 0:
-            batches.pop(0)
+            batches.popleft()
         if not batches:
             self._map_batches.pop(owner, None)
 
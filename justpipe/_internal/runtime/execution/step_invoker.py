@@ -7,7 +7,6 @@ from collections.abc import Callable
 
 from justpipe.types import (
     CancellationToken,
-    EventType,
     HookSpec,
     InjectionMetadataMap,
     NodeKind,
@@ -16,7 +15,10 @@ from justpipe.types import (
     _Next,
     _Run,
 )
-from justpipe._internal.shared.utils import _resolve_injection_kwargs
+from justpipe._internal.shared.utils import (
+    _compile_injection_resolver,
+    _resolve_injection_kwargs,
+)
 
 if TYPE_CHECKING:
     from justpipe._internal.definition.steps import _BaseStep
@@ -25,6 +27,13 @@ if TYPE_CHECKING:
 StateT = TypeVar("StateT")
 ContextT = TypeVar("ContextT")
 
+# Concrete control-flow sentinel types; a type-identity set lookup is a single
+# hash probe vs isinstance's tuple walk on the per-token streaming path.
+_SIGNAL_TYPES: frozenset[type] = frozenset({_Next, _Map, _Run, Suspend})
+
+# Max tokens accumulated before a batch is flushed to the event queue.
+_TOKEN_BATCH_SIZE = 16
+
 
 class _StepInvoker(Generic[StateT, ContextT]):
     """Encapsulates the execution logic for individual pipeline steps."""
@@ -35,11 +44,21 @@ class _StepInvoker(Generic[StateT, ContextT]):
         injection_metadata: InjectionMetadataMap,
         on_error: HookSpec | None = None,
         cancellation_token: CancellationToken | None = None,
+        batch_tokens: bool = False,
     ):
         self._steps = steps
         self._injection_metadata = injection_metadata
         self._on_error = on_error
         self._cancellation_token = cancellation_token
+        # Token batching is only safe on an unbounded queue: per-token
+        # backpressure on bounded queues must keep blocking the producer.
+        self._batch_tokens = batch_tokens
+        # Pre-compiled per-step resolvers; avoids walking injection metadata
+        # on every invocation.
+        self._resolvers = {
+            key: _compile_injection_resolver(meta)
+            for key, meta in injection_metadata.items()
+        }
 
     @property
     def global_error_handler(self) -> HookSpec | None:
@@ -86,17 +105,20 @@ class _StepInvoker(Generic[StateT, ContextT]):
 
         timeout = step.timeout
 
-        # Resolve dependencies
-        kwargs = (payload or {}).copy()
-        inj_meta = self._injection_metadata.get(name, {})
-        kwargs.update(
-            _resolve_injection_kwargs(
-                inj_meta,
+        # Resolve dependencies. The resolver returns a fresh dict, so it can
+        # be used directly in the common no-payload case; injections keep
+        # precedence over payload keys.
+        resolve = self._resolvers.get(name)
+        injections = (
+            resolve(
                 state,
                 context,
                 cancellation_token=self._cancellation_token,
             )
+            if resolve is not None
+            else {}
         )
+        kwargs = injections if not payload else {**payload, **injections}
 
         async def _exec() -> Any:
             # We await execute() which calls the middleware-wrapped function.
@@ -106,23 +128,45 @@ class _StepInvoker(Generic[StateT, ContextT]):
 
             if inspect.isasyncgen(result):
                 last_val = None
+                # Tokens are batched to amortize queue synchronization across
+                # high-throughput streams; the batch is expanded back into
+                # individual TOKEN events on the consumer side. A bounded
+                # queue effectively disables batching so each token still
+                # exerts backpressure.
+                batch_size = _TOKEN_BATCH_SIZE if self._batch_tokens else 1
+                buf: list[Any] = []
                 try:
                     async for item in result:
-                        if isinstance(item, (_Next, _Map, _Run, Suspend)):
+                        if type(item) in _SIGNAL_TYPES:
                             last_val = item
                         else:
-                            await orchestrator.emit(EventType.TOKEN, name, item)
+                            buf.append(item)
+                            if len(buf) >= batch_size:
+                                # Hand off the batch before awaiting: if the
+                                # put blocks and we get cancelled, the finally
+                                # flush must not re-await a full queue.
+                                pending, buf = buf, []
+                                await orchestrator.emit_tokens(name, pending)
                 except asyncio.CancelledError:
                     await result.aclose()
                     raise
+                finally:
+                    # Flush the tail even when the stream raises mid-flight
+                    # so already-yielded tokens are not lost. With batching
+                    # active the queue is unbounded, so this cannot block.
+                    if buf:
+                        await orchestrator.emit_tokens(name, buf)
                 return last_val
             else:
                 return result
 
         if timeout:
+            # asyncio.timeout() uses the loop's timer handle directly instead
+            # of the wrapper task asyncio.wait_for creates per call.
             try:
-                return await asyncio.wait_for(_exec(), timeout=timeout)
-            except (asyncio.TimeoutError, TimeoutError):
+                async with asyncio.timeout(timeout):
+                    return await _exec()
+            except TimeoutError:
                 raise TimeoutError(
                     f"Step '{name}' timed out after {timeout}s. "
                     f"The step did not complete within the configured timeout. "
@@ -153,14 +197,17 @@ class _StepInvoker(Generic[StateT, ContextT]):
             func = handler.func
         else:
             meta_key = f"{step_name}:on_error"
-            inj_meta = self._injection_metadata.get(meta_key, {})
-            kwargs = _resolve_injection_kwargs(
-                inj_meta,
-                state,
-                context,
-                step_name=step_name,
-                cancellation_token=self._cancellation_token,
-                error=error,
+            resolve = self._resolvers.get(meta_key)
+            kwargs = (
+                resolve(
+                    state,
+                    context,
+                    step_name=step_name,
+                    cancellation_token=self._cancellation_token,
+                    error=error,
+                )
+                if resolve is not None
+                else {}
             )
             func = handler.func if isinstance(handler, HookSpec) else handler
 
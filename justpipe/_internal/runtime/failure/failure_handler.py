@@ -1,6 +1,6 @@
 from typing import Any, TYPE_CHECKING
-import traceback
 import logging
+import reprlib
 
 from justpipe._internal.runtime.orchestration.control import InvocationContext
 from justpipe._internal.runtime.execution.step_invoker import _StepInvoker
@@ -12,6 +12,15 @@ if TYPE_CHECKING:
         FailureHandlingOrchestrator,
     )
 
+logger = logging.getLogger("justpipe.failure")
+
+# Bounded state formatter: limits the work of rendering huge states instead
+# of fully materializing str(state) and then truncating.
+_state_repr = reprlib.Repr()
+_state_repr.maxstring = 1000
+_state_repr.maxother = 1000
+_state_repr.maxdict = 20
+
 
 class _FailureHandler:
     """Manages error escalation and reporting."""
@@ -25,6 +34,9 @@ class _FailureHandler:
         self._steps = steps
         self._invoker = invoker
         self._orchestrator = orchestrator
+        # The global hook is fixed for the invoker's lifetime; cache it so
+        # the common no-handler failure path is plain attribute reads.
+        self._global_handler = invoker.global_error_handler
 
     async def handle_failure(
         self,
@@ -64,7 +76,7 @@ class _FailureHandler:
                 error = new_error
 
         # 2. Try Global Handler
-        global_handler = self._invoker.global_error_handler
+        global_handler = self._global_handler
         if global_handler:
             try:
                 res = await self._invoker.execute_handler(
@@ -143,21 +155,19 @@ class _FailureHandler:
         )
 
     def _log_error(self, name: str, error: Exception, state: Any | None) -> None:
-        stack = "".join(
-            traceback.format_exception(type(error), error, error.__traceback__)
-        )
-        state_str = str(state)[:1000]
-        logging.error(
-            "Step '%s' failed with %s: %s\nState: %s\nStack trace:\n%s",
+        state_str = _state_repr.repr(state)
+        # The traceback is rendered lazily by the handler's formatter via
+        # exc_info instead of being formatted eagerly into the message.
+        logger.error(
+            "Step '%s' failed with %s: %s\nState: %s",
             name,
             type(error).__name__,
             error,
             state_str,
-            stack,
             extra={
                 "step_name": name,
                 "error_type": type(error).__name__,
                 "state_type": type(state).__name__ if state is not None else None,
             },
-            exc_info=True,
+            exc_info=error,
         )
@@ -14,6 +14,11 @@ _current_step_meta_var: ContextVar[_ScopedMeta | None] = ContextVar(
     "_jp_current_step_meta", default=None
 )
 
+# Pre-bound accessor: skips one attribute lookup per ctx.meta.step call on
+# the hot path. The contextvar itself is load-bearing — concurrent steps run
+# as tasks on one thread, so a thread-local would alias their meta.
+_get_current_step_meta = _current_step_meta_var.get
+
 
 class _ScopedMeta:
     """Shared implementation for step and run scopes."""
@@ -71,7 +76,7 @@ class _StepMetaImpl:
 
     @staticmethod
     def _current() -> _ScopedMeta:
-        meta = _current_step_meta_var.get()
+        meta = _get_current_step_meta()
         if meta is None:
             raise RuntimeError(
                 "ctx.meta.step is only available inside a step execution"
@@ -147,22 +152,15 @@ def _is_meta_type(tp: Any) -> bool:
     return False
 
 
-def detect_and_init_meta(
-    context: Any,
-    pipe_metadata: dict[str, Any] | None = None,
-) -> _MetaImpl | None:
-    """Scan context type hints for Meta-typed field, init with implementation.
-
-    Returns the _MetaImpl instance if Meta field found and initialized, None otherwise.
-
-    Raises:
-        DefinitionError: If context is frozen or has multiple Meta fields.
-    """
-    if context is None:
-        return None
+# Memoized Meta field detection per context type; get_type_hints and the
+# annotation scan are pure reflection over the type, so repeated runs with
+# the same context class skip them entirely. Invalid types (frozen, multiple
+# Meta fields) raise before caching and are re-checked on each run.
+_meta_field_cache: dict[type, str | None] = {}
 
-    ctx_type = type(context)
 
+def _resolve_meta_field(ctx_type: type) -> str | None:
+    """Find and validate the Meta-typed field name on a context type."""
     # Get type hints
     try:
         hints = get_type_hints(ctx_type)
@@ -199,6 +197,33 @@ def detect_and_init_meta(
                     "Use `@dataclass` without `frozen=True`."
                 )
 
+    return field_name
+
+
+def detect_and_init_meta(
+    context: Any,
+    pipe_metadata: dict[str, Any] | None = None,
+) -> _MetaImpl | None:
+    """Scan context type hints for Meta-typed field, init with implementation.
+
+    Returns the _MetaImpl instance if Meta field found and initialized, None otherwise.
+
+    Raises:
+        DefinitionError: If context is frozen or has multiple Meta fields.
+    """
+    if context is None:
+        return None
+
+    ctx_type = type(context)
+    if ctx_type in _meta_field_cache:
+        field_name = _meta_field_cache[ctx_type]
+    else:
+        field_name = _resolve_meta_field(ctx_type)
+        _meta_field_cache[ctx_type] = field_name
+
+    if field_name is None:
+        return None
+
     meta_impl = _MetaImpl(pipe_metadata)
     setattr(context, field_name, meta_impl)
     return meta_impl
@@ -12,6 +12,13 @@ class RuntimeEvent:
     event: Event
 
 
+@dataclass(frozen=True, slots=True)
+class RuntimeEventBatch:
+    # Pre-built events queued for publication as a single queue item,
+    # amortizing queue synchronization across token-heavy streams.
+    events: tuple[Event, ...]
+
+
 @dataclass(frozen=True, slots=True)
 class InvocationContext:
     # Unique ID for this concrete step invocation.
@@ -6,6 +6,7 @@ from typing import Any, Generic, TypeVar
 from justpipe._internal.runtime.orchestration.control import (
     InvocationContext,
     RuntimeEvent,
+    RuntimeEventBatch,
     StepCompleted,
 )
 from justpipe._internal.runtime.failure.failure_handler import _FailureHandler
@@ -72,7 +73,9 @@ class _Orchestrator(Generic[StateT, ContextT], TaskOrchestrator[StateT, ContextT
         return self._tracker
 
     # --- QueueSubmitPort ---
-    async def submit(self, item: RuntimeEvent | StepCompleted) -> None:
+    async def submit(
+        self, item: RuntimeEvent | RuntimeEventBatch | StepCompleted
+    ) -> None:
         await self._kernel.submit(item)
 
     # --- EventEmitPort ---
@@ -107,6 +110,19 @@ class _Orchestrator(Generic[StateT, ContextT], TaskOrchestrator[StateT, ContextT
             )
         )
 
+    async def emit_tokens(self, stage: str, tokens: list[Any]) -> None:
+        if len(tokens) == 1:
+            await self.emit(EventType.TOKEN, stage, tokens[0])
+            return
+        await self.submit(
+            RuntimeEventBatch(
+                events=tuple(
+                    Event(type=EventType.TOKEN, stage=stage, payload=token)
+                    for token in tokens
+                )
+            )
+        )
+
     # --- StepCompletionPort ---
     async def complete_step(
         self,
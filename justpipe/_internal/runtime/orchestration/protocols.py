@@ -89,6 +89,8 @@ class EventEmitPort(Protocol):
         meta: dict[str, Any] | None = None,
     ) -> None: ...
 
+    async def emit_tokens(self, stage: str, tokens: list[Any]) -> None: ...
+
 
 @runtime_checkable
 class StepCompletionPort(Protocol):
@@ -17,6 +17,9 @@ class _RuntimeKernel:
     ):
         self._tracker = tracker
         self._queue = queue
+        # An unbounded queue can never block, so submissions can skip the
+        # await and its per-item coroutine overhead.
+        self._unbounded = queue.maxsize <= 0
         self._task_group: asyncio.TaskGroup | None = None
         self._on_spawn: Callable[[int], None] | None = None
         self._on_submit_queue_depth: Callable[[int], None] | None = None
@@ -56,6 +59,9 @@ class _RuntimeKernel:
         return self._task_group.create_task(coro)
 
     async def submit(self, item: Any) -> None:
-        await self._queue.put(item)
+        if self._unbounded:
+            self._queue.put_nowait(item)
+        else:
+            await self._queue.put(item)
         if self._on_submit_queue_depth is not None:
             self._on_submit_queue_depth(self._queue.qsize())
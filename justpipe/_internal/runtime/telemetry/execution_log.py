@@ -21,7 +21,7 @@ _FAILURE_PRIORITY: dict[FailureKind, int] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class _FailureEntry:
     kind: FailureKind
     source: FailureSource
@@ -44,7 +44,7 @@ _TERMINAL_SIGNAL_STATUS: dict[_TerminalSignal, PipelineTerminalStatus] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class _ExecutionLog:
     failures: list[_FailureEntry] = field(default_factory=list)
     diagnostics: list[FailureRecord] = field(default_factory=list)
@@ -92,7 +92,7 @@ class _ExecutionLog:
         self.cancelled = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ResolvedOutcome:
     status: PipelineTerminalStatus
     reason: FailureReason | None
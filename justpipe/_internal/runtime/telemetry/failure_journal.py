@@ -12,6 +12,16 @@ from justpipe.types import (
 )
 
 
+# Diagnostic message templates, formatted only on the (rare) classifier
+# misbehavior paths instead of rebuilding the fixed text per failure.
+_CLASSIFIER_RAISED_TMPL = (
+    "failure_classification.source_classifier raised an exception: {}: {}"
+)
+_CLASSIFIER_INVALID_TMPL = (
+    "failure_classification.source_classifier returned invalid value: {!r}"
+)
+
+
 class _FailureJournal:
     """Owns failure classification policy and recording."""
 
@@ -33,8 +43,21 @@ class _FailureJournal:
     def __init__(self, config: FailureClassificationConfig | None = None) -> None:
         cfg = config or FailureClassificationConfig()
         self._source_classifier: FailureSourceClassifier | None = cfg.source_classifier
+        # Share the default tuple when no custom prefixes are configured
+        # (the common case); only merged configs allocate a new tuple.
         self._external_dep_prefixes = (
             self._DEFAULT_EXTERNAL_DEP_PREFIXES + cfg.external_dependency_prefixes
+            if cfg.external_dependency_prefixes
+            else self._DEFAULT_EXTERNAL_DEP_PREFIXES
+        )
+        # Undotted prefixes name top-level modules and are matched with one
+        # frozenset probe against the module's first segment; only dotted
+        # prefixes (e.g. "mylib.errors") keep startswith semantics.
+        self._external_dep_top_modules = frozenset(
+            p for p in self._external_dep_prefixes if "." not in p
+        )
+        self._external_dep_dotted_prefixes = tuple(
+            p for p in self._external_dep_prefixes if "." in p
         )
 
     def record_failure(
@@ -94,10 +117,7 @@ class _FailureJournal:
                 kind=FailureKind.INFRA,
                 source=FailureSource.FRAMEWORK,
                 reason=FailureReason.CLASSIFIER_ERROR,
-                error=(
-                    "failure_classification.source_classifier raised an exception: "
-                    f"{type(exc).__name__}: {exc}"
-                ),
+                error=_CLASSIFIER_RAISED_TMPL.format(type(exc).__name__, exc),
                 step=step,
             )
             return resolved_source, diagnostic
@@ -112,10 +132,7 @@ class _FailureJournal:
             kind=FailureKind.INFRA,
             source=FailureSource.FRAMEWORK,
             reason=FailureReason.CLASSIFIER_ERROR,
-            error=(
-                "failure_classification.source_classifier "
-                f"returned invalid value: {user_source!r}"
-            ),
+            error=_CLASSIFIER_INVALID_TMPL.format(user_source),
             step=step,
         )
         return resolved_source, diagnostic
@@ -126,6 +143,10 @@ class _FailureJournal:
         if error is None:
             return default
         module = type(error).__module__
-        if module.startswith(self._external_dep_prefixes):
+        if module.partition(".")[0] in self._external_dep_top_modules:
+            return FailureSource.EXTERNAL_DEP
+        if self._external_dep_dotted_prefixes and module.startswith(
+            self._external_dep_dotted_prefixes
+        ):
             return FailureSource.EXTERNAL_DEP
         return default
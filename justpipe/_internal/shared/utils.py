@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -22,17 +23,27 @@ def format_duration(seconds: float | None) -> str:
     return f"{seconds / 3600:.1f}h"
 
 
-def resolve_storage_path() -> Path:
-    """Resolve the base storage directory from env or default.
+@functools.lru_cache(maxsize=2)
+def _storage_path_for(raw: str | None) -> Path:
+    """Build the storage path for a raw env value.
 
-    Reads JUSTPIPE_STORAGE_PATH env var, falls back to ~/.justpipe.
+    Keyed on the env value itself, so changes to the variable (e.g. via
+    monkeypatch in tests) naturally miss the cache while repeat calls skip
+    Path construction and home-directory resolution.
     """
-    raw = os.getenv("JUSTPIPE_STORAGE_PATH")
     if raw:
         return Path(raw).expanduser()
     return Path.home() / ".justpipe"
 
 
+def resolve_storage_path() -> Path:
+    """Resolve the base storage directory from env or default.
+
+    Reads JUSTPIPE_STORAGE_PATH env var, falls back to ~/.justpipe.
+    """
+    return _storage_path_for(os.getenv("JUSTPIPE_STORAGE_PATH"))
+
+
 def _resolve_name(target: str | Callable[..., Any]) -> str:
     """Resolve a name string from a string or callable target."""
     if isinstance(target, str):
@@ -89,3 +100,41 @@ def _resolve_injection_kwargs(
         for param_name, source in inj_meta.items()
         if source in source_values
     }
+
+
+# Maps each injectable source to its position in the resolver's value tuple.
+_SOURCE_INDEX: dict[InjectionSource, int] = {
+    InjectionSource.STATE: 0,
+    InjectionSource.CONTEXT: 1,
+    InjectionSource.ERROR: 2,
+    InjectionSource.STEP_NAME: 3,
+    InjectionSource.CANCEL: 4,
+}
+
+
+def _compile_injection_resolver(
+    inj_meta: InjectionMetadata,
+) -> Callable[..., dict[str, Any]]:
+    """Pre-compile injection metadata into a resolver closure.
+
+    The metadata walk and source dispatch happen once here instead of on
+    every step invocation; the returned closure only builds the kwargs
+    dict from pre-indexed entries.
+    """
+    entries = tuple(
+        (param_name, _SOURCE_INDEX[source])
+        for param_name, source in inj_meta.items()
+        if source in _SOURCE_INDEX
+    )
+
+    def resolver(
+        state: Any,
+        context: Any,
+        error: Exception | None = None,
+        step_name: str | None = None,
+        cancellation_token: CancellationToken | None = None,
+    ) -> dict[str, Any]:
+        values = (state, context, error, step_name, cancellation_token)
+        return {param_name: values[index] for param_name, index in entries}
+
+    return resolver
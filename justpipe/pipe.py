@@ -303,7 +303,7 @@ class Pipe(Generic[StateT, ContextT]):
         for info in self.registry.step_registry.get_steps_info():
             node: dict[str, Any] = {
                 "kind": info.kind.value,
-                "targets": info.targets,
+                "targets": list(info.targets),
             }
             if info.timeout is not None:
                 node["timeout"] = info.timeout
@@ -420,7 +420,7 @@ class Pipe(Generic[StateT, ContextT]):
 
         return observers
 
-    async def run(
+    def run(
         self,
         state: StateT,
         context: ContextT | None = None,
@@ -453,5 +453,6 @@ class Pipe(Generic[StateT, ContextT]):
         )
         runner = build_runner(config)
 
-        async for event in runner.run(state, context, start, timeout):
-            yield event
+        # Return the runner's stream directly: a re-yielding wrapper here
+        # would add a generator frame (and an extra await) per event.
+        return runner.run(state, context, start, timeout)
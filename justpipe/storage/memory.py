@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import json
 from datetime import datetime, timezone
 
@@ -18,19 +19,47 @@ class InMemoryBackend:
 
     def __init__(self) -> None:
         self._runs: dict[str, RunRecord] = {}
-        self._events: dict[str, list[str]] = {}  # run_id -> serialized JSON
+        # Sorted run ids so prefix lookups bisect to the match range instead
+        # of scanning every run.
+        self._sorted_ids: list[str] = []
+        # run_id -> events parsed once at write time; None marks entries with
+        # an invalid/unknown type (they still consume a seq slot).
+        self._events: dict[str, list[StoredEvent | None]] = {}
+
+    @staticmethod
+    def _parse_event(seq: int, data_str: str) -> StoredEvent | None:
+        parsed = json.loads(data_str)
+        try:
+            event_type_val = EventType(parsed.get("type", ""))
+        except ValueError:
+            return None
+        return StoredEvent(
+            seq=seq,
+            timestamp=datetime.fromtimestamp(
+                parsed.get("timestamp", 0), tz=timezone.utc
+            ),
+            event_type=event_type_val,
+            step_name=parsed.get("stage", ""),
+            data=data_str,
+        )
+
+    def _append_parsed(self, run_id: str, events: list[str]) -> None:
+        existing = self._events.setdefault(run_id, [])
+        seq = len(existing)
+        existing.extend(
+            self._parse_event(seq + i, data) for i, data in enumerate(events, start=1)
+        )
 
     def save_run(self, run: RunRecord, events: list[str]) -> None:
+        if run.run_id not in self._runs:
+            bisect.insort(self._sorted_ids, run.run_id)
         self._runs[run.run_id] = run
         if events:
-            existing = self._events.get(run.run_id, [])
-            existing.extend(events)
-            self._events[run.run_id] = existing
+            self._append_parsed(run.run_id, events)
         # If events is empty, keep any previously appended events
 
     def append_events(self, run_id: str, events: list[str]) -> None:
-        existing = self._events.setdefault(run_id, [])
-        existing.extend(events)
+        self._append_parsed(run_id, events)
 
     def get_run(self, run_id: str) -> RunRecord | None:
         return self._runs.get(run_id)
@@ -52,34 +81,20 @@ class InMemoryBackend:
         run_id: str,
         event_type: EventType | None = None,
     ) -> list[StoredEvent]:
-        raw = self._events.get(run_id, [])
-        result: list[StoredEvent] = []
-        for seq, data_str in enumerate(raw, start=1):
-            parsed = json.loads(data_str)
-            et = parsed.get("type", "")
-            try:
-                event_type_val = EventType(et)
-            except ValueError:
-                continue
-            if event_type is not None and event_type_val != event_type:
-                continue
-            result.append(
-                StoredEvent(
-                    seq=seq,
-                    timestamp=datetime.fromtimestamp(
-                        parsed.get("timestamp", 0), tz=timezone.utc
-                    ),
-                    event_type=event_type_val,
-                    step_name=parsed.get("stage", ""),
-                    data=data_str,
-                )
-            )
-        return result
+        parsed = self._events.get(run_id, [])
+        if event_type is None:
+            return [e for e in parsed if e is not None]
+        return [e for e in parsed if e is not None and e.event_type == event_type]
 
     def find_runs_by_prefix(
         self, run_id_prefix: str, limit: int = 10
     ) -> list[RunRecord]:
-        matches = [r for r in self._runs.values() if r.run_id.startswith(run_id_prefix)]
+        ids = self._sorted_ids
+        i = bisect.bisect_left(ids, run_id_prefix)
+        matches: list[RunRecord] = []
+        while i < len(ids) and ids[i].startswith(run_id_prefix):
+            matches.append(self._runs[ids[i]])
+            i += 1
         matches.sort(key=lambda r: r.start_time, reverse=True)
         return matches[:limit]
 
@@ -87,5 +102,6 @@ class InMemoryBackend:
         if run_id not in self._runs:
             return False
         del self._runs[run_id]
+        self._sorted_ids.remove(run_id)
         self._events.pop(run_id, None)
         return True
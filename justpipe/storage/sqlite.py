@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import json
+import queue
 import re
 import sqlite3
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
@@ -42,6 +43,9 @@ CREATE TABLE IF NOT EXISTS events (
     attempt INTEGER GENERATED ALWAYS AS (json_extract(data, '$.attempt')) STORED
 );
 
+-- Query coverage: list_runs (time order), list_runs(status=...) pagination,
+-- get_events seq order, get_events(event_type=...) filter, step timelines.
+-- find_runs_by_prefix range-scans the runs PK (LIKE 'prefix%').
 CREATE INDEX IF NOT EXISTS idx_runs_time ON runs(start_time DESC);
 CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status, start_time DESC);
 CREATE INDEX IF NOT EXISTS idx_events_run_seq ON events(run_id, seq);
@@ -50,6 +54,48 @@ CREATE INDEX IF NOT EXISTS idx_events_step ON events(run_id, step_name, event_ty
 """
 
 
+# Stable SQL text so the driver's per-connection statement LRU
+# (cached_statements) keeps the parsed plans warm across calls.
+_SQL_SELECT_PLACEHOLDER = "SELECT 1 FROM runs WHERE run_id = ? AND status = 'running'"
+_SQL_UPDATE_RUN = """UPDATE runs
+   SET start_time = ?, end_time = ?, duration_s = ?,
+       status = ?, error_message = ?, error_step = ?,
+       run_meta = ?
+   WHERE run_id = ?"""
+_SQL_INSERT_RUN = """INSERT INTO runs
+   (run_id, start_time, end_time, duration_s, status,
+    error_message, error_step, run_meta)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+# Timestamps/seq are pulled out of the serialized event by SQLite's C-level
+# json_extract instead of a Python-side json.loads per event.
+_SQL_INSERT_EVENT = """INSERT INTO events (run_id, seq, timestamp, data)
+   VALUES (?, ?, COALESCE(json_extract(?, '$.timestamp'), 0), ?)"""
+_SQL_INSERT_PLACEHOLDER = """INSERT OR IGNORE INTO runs
+   (run_id, start_time, status)
+   VALUES (?, ?, ?)"""
+_SQL_INSERT_EVENT_IGNORE = """INSERT OR IGNORE INTO events (run_id, seq, timestamp, data)
+   VALUES (?, COALESCE(json_extract(?, '$.seq'), 0),
+           COALESCE(json_extract(?, '$.timestamp'), 0), ?)"""
+_SQL_SELECT_RUN = "SELECT * FROM runs WHERE run_id = ?"
+_SQL_SELECT_EVENTS = (
+    "SELECT seq, timestamp, event_type, step_name, data "
+    "FROM events WHERE run_id = ? ORDER BY seq ASC"
+)
+_SQL_SELECT_EVENTS_BY_TYPE = (
+    "SELECT seq, timestamp, event_type, step_name, data "
+    "FROM events WHERE run_id = ? AND event_type = ? ORDER BY seq ASC"
+)
+_SQL_SELECT_RUNS_BY_PREFIX = (
+    "SELECT * FROM runs WHERE run_id LIKE ? ESCAPE '\\' "
+    "ORDER BY start_time DESC LIMIT ?"
+)
+_SQL_DELETE_RUN = "DELETE FROM runs WHERE run_id = ?"
+
+# Valid run-id prefixes: the charset blocks LIKE/SQL metacharacters and the
+# length cap bounds regex and range-scan work on hostile input.
+_RUN_ID_SAFE = re.compile(r"^[a-zA-Z0-9\-_]{1,128}$")
+
+
 class SQLiteBackend:
     """SQLite-based storage backend using stdlib sqlite3.
 
@@ -59,6 +105,12 @@ class SQLiteBackend:
     def __init__(self, db_path: str | Path) -> None:
         self._db_path = Path(db_path)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Connections are pooled per instance: one serialized writer plus
+        # reader connections recycled through a queue, so operations skip
+        # the per-call open (db/-wal/-shm) and WAL-header recovery.
+        self._write_lock = threading.Lock()
+        self._write_conn: sqlite3.Connection | None = None
+        self._read_pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
         self._init_schema()
 
     def _init_schema(self) -> None:
@@ -66,6 +118,9 @@ class SQLiteBackend:
         try:
             conn.executescript(_SCHEMA)
             self._migrate(conn)
+            # Mask 0x10002 limits optimize to analysis of changed tables,
+            # seeding planner stats right after index creation.
+            conn.execute("PRAGMA optimize=0x10002")
         finally:
             conn.close()
 
@@ -87,30 +142,70 @@ class SQLiteBackend:
         conn.commit()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+        # The observer drives this backend from asyncio.to_thread workers,
+        # so pooled connections must be usable across threads.
+        conn = sqlite3.connect(
+            self._db_path, check_same_thread=False, cached_statements=256
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        # Per-connection tuning (journal_mode=WAL is persistent and set by
+        # the schema script): NORMAL sync is durable enough under WAL and
+        # avoids an fsync per commit; busy_timeout keeps concurrent
+        # reader/writer instances from failing fast with SQLITE_BUSY.
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -20000")
         return conn
 
     @contextmanager
     def _conn(self) -> Iterator[sqlite3.Connection]:
-        conn = self._connect()
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
         try:
             yield conn
         finally:
-            conn.close()
+            self._read_pool.put(conn)
 
     @contextmanager
     def _transaction(self) -> Iterator[sqlite3.Connection]:
-        conn = self._connect()
+        with self._write_lock:
+            if self._write_conn is None:
+                self._write_conn = self._connect()
+            conn = self._write_conn
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self) -> None:
+        """Close the pooled connections. The backend reopens them on demand."""
+        with self._write_lock:
+            if self._write_conn is not None:
+                try:
+                    # Refresh planner statistics so the next process starts
+                    # with warm query plans (cheap no-op when nothing changed).
+                    self._write_conn.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._write_conn.close()
+                self._write_conn = None
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __del__(self) -> None:
         try:
-            yield conn
-            conn.commit()
+            self.close()
         except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+            pass
 
     def save_run(self, run: RunRecord, events: list[str]) -> None:
         with self._transaction() as conn:
@@ -118,7 +213,7 @@ class SQLiteBackend:
             # UPDATE it in place.  INSERT OR REPLACE would trigger ON DELETE
             # CASCADE and destroy already-flushed events.
             placeholder = conn.execute(
-                "SELECT 1 FROM runs WHERE run_id = ? AND status = 'running'",
+                _SQL_SELECT_PLACEHOLDER,
                 (run.run_id,),
             ).fetchone()
 
@@ -128,11 +223,7 @@ class SQLiteBackend:
 
             if placeholder:
                 conn.execute(
-                    """UPDATE runs
-                       SET start_time = ?, end_time = ?, duration_s = ?,
-                           status = ?, error_message = ?, error_step = ?,
-                           run_meta = ?
-                       WHERE run_id = ?""",
+                    _SQL_UPDATE_RUN,
                     (
                         start_ts,
                         end_ts,
@@ -146,10 +237,7 @@ class SQLiteBackend:
                 )
             else:
                 conn.execute(
-                    """INSERT INTO runs
-                       (run_id, start_time, end_time, duration_s, status,
-                        error_message, error_step, run_meta)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                    _SQL_INSERT_RUN,
                     (
                         run.run_id,
                         start_ts,
@@ -161,38 +249,29 @@ class SQLiteBackend:
                         run.run_meta,
                     ),
                 )
-            for seq, data in enumerate(events, start=1):
-                parsed = json.loads(data)
-                conn.execute(
-                    """INSERT INTO events (run_id, seq, timestamp, data)
-                       VALUES (?, ?, ?, ?)""",
-                    (run.run_id, seq, parsed.get("timestamp", 0), data),
+            if events:
+                conn.executemany(
+                    _SQL_INSERT_EVENT,
+                    [
+                        (run.run_id, seq, data, data)
+                        for seq, data in enumerate(events, start=1)
+                    ],
                 )
 
     def append_events(self, run_id: str, events: list[str]) -> None:
         with self._transaction() as conn:
             # Ensure a placeholder run row exists for FK constraints.
             # The final save_run call will update it with real metadata.
-            conn.execute(
-                """INSERT OR IGNORE INTO runs
-                   (run_id, start_time, status)
-                   VALUES (?, ?, ?)""",
-                (run_id, 0, "running"),
-            )
-            for data in events:
-                parsed = json.loads(data)
-                seq = parsed.get("seq", 0)
-                conn.execute(
-                    """INSERT OR IGNORE INTO events (run_id, seq, timestamp, data)
-                       VALUES (?, ?, ?, ?)""",
-                    (run_id, seq, parsed.get("timestamp", 0), data),
+            conn.execute(_SQL_INSERT_PLACEHOLDER, (run_id, 0, "running"))
+            if events:
+                conn.executemany(
+                    _SQL_INSERT_EVENT_IGNORE,
+                    [(run_id, data, data, data) for data in events],
                 )
 
     def get_run(self, run_id: str) -> RunRecord | None:
         with self._conn() as conn:
-            row = conn.execute(
-                "SELECT * FROM runs WHERE run_id = ?", (run_id,)
-            ).fetchone()
+            row = conn.execute(_SQL_SELECT_RUN, (run_id,)).fetchone()
             return self._row_to_run(row) if row else None
 
     def list_runs(
@@ -209,7 +288,14 @@ class SQLiteBackend:
                 params.append(status.value)
             query += " ORDER BY start_time DESC LIMIT ? OFFSET ?"
             params.extend([limit, offset])
-            return [self._row_to_run(r) for r in conn.execute(query, params).fetchall()]
+            cursor = conn.execute(query, params)
+            return [self._row_to_run(r) for r in self._iter_rows(cursor)]
+
+    @staticmethod
+    def _iter_rows(cursor: sqlite3.Cursor) -> Iterator[sqlite3.Row]:
+        """Stream rows in fetchmany batches instead of materializing fetchall."""
+        while rows := cursor.fetchmany(512):
+            yield from rows
 
     def get_events(
         self,
@@ -217,25 +303,18 @@ class SQLiteBackend:
         event_type: EventType | None = None,
     ) -> list[StoredEvent]:
         with self._conn() as conn:
-            query = (
-                "SELECT seq, timestamp, event_type, step_name, data "
-                "FROM events WHERE run_id = ?"
-            )
-            params: list[Any] = [run_id]
             if event_type is not None:
-                query += " AND event_type = ?"
-                params.append(event_type.value)
-            query += " ORDER BY seq ASC"
-            return [
-                self._row_to_event(r) for r in conn.execute(query, params).fetchall()
-            ]
-
-    _RUN_ID_SAFE = re.compile(r"^[a-zA-Z0-9\-_]+$")
+                cursor = conn.execute(
+                    _SQL_SELECT_EVENTS_BY_TYPE, (run_id, event_type.value)
+                )
+            else:
+                cursor = conn.execute(_SQL_SELECT_EVENTS, (run_id,))
+            return [self._row_to_event(r) for r in self._iter_rows(cursor)]
 
     def find_runs_by_prefix(
         self, run_id_prefix: str, limit: int = 10
     ) -> list[RunRecord]:
-        if not run_id_prefix or not self._RUN_ID_SAFE.match(run_id_prefix):
+        if not run_id_prefix or not _RUN_ID_SAFE.match(run_id_prefix):
             return []
         with self._conn() as conn:
             escaped = (
@@ -244,14 +323,14 @@ class SQLiteBackend:
                 .replace("_", "\\_")
             )
             rows = conn.execute(
-                "SELECT * FROM runs WHERE run_id LIKE ? ESCAPE '\\' ORDER BY start_time DESC LIMIT ?",
+                _SQL_SELECT_RUNS_BY_PREFIX,
                 (escaped + "%", limit),
             ).fetchall()
             return [self._row_to_run(r) for r in rows]
 
     def delete_run(self, run_id: str) -> bool:
         with self._transaction() as conn:
-            cursor = conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            cursor = conn.execute(_SQL_DELETE_RUN, (run_id,))
             return cursor.rowcount > 0
 
     @staticmethod
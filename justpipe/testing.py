@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, TypeVar, Generic, cast
 from collections.abc import Callable
 from unittest.mock import AsyncMock
@@ -17,30 +18,41 @@ class TestResult(Generic[StateT]):
     events: list[Event]
     final_state: StateT
 
+    @cached_property
+    def _events_by_type(self) -> dict[EventType, list[Event]]:
+        """Events bucketed by type, built once on first accessor use."""
+        buckets: dict[EventType, list[Event]] = {}
+        for e in self.events:
+            buckets.setdefault(e.type, []).append(e)
+        return buckets
+
+    @cached_property
+    def _seen_stages(self) -> frozenset[str]:
+        return frozenset(e.stage for e in self.events)
+
     def filter(self, event_type: EventType) -> list[Event]:
         """Filter events by type."""
-        return [e for e in self.events if e.type == event_type]
+        return list(self._events_by_type.get(event_type, ()))
 
     @property
     def step_starts(self) -> list[str]:
         """Names of steps that started."""
-        return [e.stage for e in self.events if e.type == EventType.STEP_START]
+        return [e.stage for e in self._events_by_type.get(EventType.STEP_START, ())]
 
     @property
     def tokens(self) -> list[Any]:
         """All data tokens yielded by steps (EventType.TOKEN)."""
-        return [e.payload for e in self.events if e.type == EventType.TOKEN]
+        return [e.payload for e in self._events_by_type.get(EventType.TOKEN, ())]
 
     def was_called(self, stage: str) -> bool:
         """Check if a specific step or hook was executed."""
-        return any(e.stage == stage for e in self.events)
+        return stage in self._seen_stages
 
     def find_error(self, stage: str | None = None) -> str | None:
         """Find error message for a specific stage or the first error found."""
-        for e in self.events:
-            if e.type == EventType.STEP_ERROR:
-                if stage is None or e.stage == stage:
-                    return str(e.payload)
+        for e in self._events_by_type.get(EventType.STEP_ERROR, ()):
+            if stage is None or e.stage == stage:
+                return str(e.payload)
         return None
 
 
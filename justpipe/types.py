@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Any, Protocol
 from collections.abc import Callable
 import asyncio
+import sys
 import time
 
 
@@ -136,6 +137,13 @@ class Event:
     # Canonical event content must live in `payload` (not duplicated here).
     meta: dict[str, Any] | None = None
 
+    def __post_init__(self) -> None:
+        # Stage names repeat across thousands of events per run; interning
+        # turns the equality checks in filters/bucketizers into pointer
+        # comparisons.
+        if type(self.stage) is str:
+            object.__setattr__(self, "stage", sys.intern(self.stage))
+
 
 class ScopedMeta(Protocol):
     """Writable metadata scope. Used for both step and run.
@@ -203,7 +211,7 @@ class PipelineTerminalStatus(Enum):
     CLIENT_CLOSED = "client_closed"
 
 
-class FailureKind(Enum):
+class FailureKind(str, Enum):
     """Lifecycle area where a failure occurred."""
 
     NONE = "none"
@@ -214,7 +222,7 @@ class FailureKind(Enum):
     INFRA = "infra"
 
 
-class FailureSource(Enum):
+class FailureSource(str, Enum):
     """Source responsible for a failure."""
 
     NONE = "none"
@@ -245,7 +253,7 @@ class StepStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailureClassificationContext:
     """Context passed to user-defined failure source classifiers."""
 
@@ -259,7 +267,7 @@ class FailureClassificationContext:
 FailureSourceClassifier = Callable[[FailureClassificationContext], FailureSource | None]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailureClassificationConfig:
     """Configuration for failure source attribution."""
 
@@ -414,7 +422,7 @@ class StepContext:
     retries: int | dict[str, Any] = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StepInfo:
     """Information about a registered step for introspection."""
 
@@ -423,7 +431,7 @@ class StepInfo:
     retries: int | dict[str, Any]
     barrier_timeout: float | None
     has_error_handler: bool
-    targets: list[str]
+    targets: tuple[str, ...]
     kind: NodeKind
     sub_pipeline_hash: str | None = None
 
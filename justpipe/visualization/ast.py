@@ -18,7 +18,7 @@ class VisualNodeKind(Enum):
     SUB = "sub"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VisualNode:
     """A single step in the pipeline."""
 
@@ -49,7 +49,7 @@ class VisualNode:
         return d
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VisualEdge:
     """Connection between nodes."""
 
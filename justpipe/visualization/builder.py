@@ -1,6 +1,7 @@
 """Builder for VisualAST from pipeline structure."""
 
 import ast
+import functools
 import inspect
 import textwrap
 from typing import Any
@@ -31,6 +32,12 @@ _VIS_KIND: dict[NodeKind, VisualNodeKind] = {
 class _PipelineASTBuilder:
     """Builds VisualAST from pipeline internals."""
 
+    @classmethod
+    @functools.cache
+    def empty(cls) -> VisualAST:
+        """Shared empty AST; built once since the result is never mutated."""
+        return cls.build({}, {})
+
     @classmethod
     def build(
         cls,
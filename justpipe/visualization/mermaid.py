@@ -2,14 +2,19 @@
 
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 from justpipe.visualization.ast import VisualNodeKind, VisualAST, VisualNode
 from justpipe.types import BarrierType
 
 
-@dataclass
+@dataclass(frozen=True)
 class MermaidTheme:
-    """Styling configuration for Mermaid diagrams."""
+    """Styling configuration for Mermaid diagrams.
+
+    Frozen so themes can be shared across renderers and the rendered style
+    block memoized per instance.
+    """
 
     direction: str = "TD"
 
@@ -52,9 +57,9 @@ class MermaidTheme:
         """Render the Mermaid graph header."""
         return f"graph {self.direction}"
 
-    def render_styles(self) -> list[str]:
-        """Render Mermaid class definitions."""
-        return [
+    @cached_property
+    def _styles(self) -> tuple[str, ...]:
+        return (
             "%% Styling",
             "classDef default fill:#f8f9fa,stroke:#dee2e6,stroke-width:1px;",
             f"classDef step fill:{self.step_fill},stroke:{self.step_stroke},stroke-width:2px,color:{self.step_color};",
@@ -64,7 +69,36 @@ class MermaidTheme:
             f"classDef sub fill:{self.sub_fill},stroke:{self.sub_stroke},stroke-width:2px,color:{self.sub_color};",
             f"classDef isolated fill:{self.isolated_fill},stroke:{self.isolated_stroke},stroke-width:2px,stroke-dasharray: 5 5,color:{self.isolated_color};",
             f"classDef startEnd fill:{self.start_end_fill},stroke:{self.start_end_stroke},stroke-width:3px,color:{self.start_end_color};",
-        ]
+        )
+
+    def render_styles(self) -> list[str]:
+        """Render Mermaid class definitions."""
+        return list(self._styles)
+
+
+# Shared default theme; frozen, so one instance serves every renderer and its
+# memoized style block is rendered once per process.
+_DEFAULT_THEME = MermaidTheme()
+
+
+# Indentation strings precomputed by space count; render uses 4-space levels
+# so 16 covers nesting four sub-graphs deep before the fallback kicks in.
+_INDENTS = tuple(" " * i for i in range(17))
+
+# Shape template per node kind, resolved with one dict probe per node.
+_DEFAULT_SHAPE_TEMPLATE = '{id}["{label}"]'
+_SHAPE_TEMPLATES: dict[VisualNodeKind, str] = {
+    VisualNodeKind.SWITCH: '{id}{{"{label}"}}',
+    VisualNodeKind.MAP: '{id}[["{label}"]]',
+    VisualNodeKind.SUB: '{id}[/"{label}" /]',
+    VisualNodeKind.STREAMING: '{id}(["{label} ⚡"])',
+}
+
+
+@lru_cache(maxsize=1024)
+def _format_label(name: str) -> str:
+    """Format a node label for display; cached since names repeat per render."""
+    return name.replace('"', "&quot;").replace("_", " ").title()
 
 
 class _MermaidRenderer:
@@ -72,11 +106,20 @@ class _MermaidRenderer:
 
     def __init__(self, ast: VisualAST, theme: MermaidTheme | None = None):
         self.ast = ast
-        self.theme = theme or MermaidTheme()
+        self.theme = theme or _DEFAULT_THEME
         self.lines: list[str] = [self.theme.render_header()]
+        self._rendered: str | None = None
 
     def render(self) -> str:
-        """Generate complete Mermaid diagram."""
+        """Generate complete Mermaid diagram.
+
+        The output is memoized: the AST is not mutated after construction,
+        and caching also keeps repeat calls from re-appending content to
+        ``lines``.
+        """
+        if self._rendered is not None:
+            return self._rendered
+
         self._render_graph_content(self.ast, prefix="", indent=4)
 
         # Render styles at the end
@@ -84,15 +127,17 @@ class _MermaidRenderer:
         for style_line in self.theme.render_styles():
             self._add(style_line, indent=4)
 
-        return "\n".join(self.lines)
+        self._rendered = "\n".join(self.lines)
+        return self._rendered
 
     def _add(self, line: str, indent: int = 4) -> None:
         """Append a line with proper indentation."""
-        self.lines.append(" " * indent + line)
+        prefix = _INDENTS[indent] if indent < len(_INDENTS) else " " * indent
+        self.lines.append(prefix + line)
 
     def _format_label(self, name: str) -> str:
         """Format a node label for display."""
-        return name.replace('"', "&quot;").replace("_", " ").title()
+        return _format_label(name)
 
     def _render_node(
         self,
@@ -110,19 +155,8 @@ class _MermaidRenderer:
         if node.is_map_target:
             node_def = f'{node_id}@{{ shape: procs, label: "{label}" }}'
         else:
-            match node.kind:
-                case VisualNodeKind.SWITCH:
-                    node_def = f'{node_id}{{"{label}"}}'
-                case VisualNodeKind.MAP:
-                    node_def = f'{node_id}[["{label}"]]'
-                case VisualNodeKind.SUB:
-                    node_def = f'{node_id}[/"{label}" /]'
-                case VisualNodeKind.STREAMING:
-                    label = f"{label} ⚡"
-                    node_def = f'{node_id}(["{label}"])'
-
-                case _:
-                    node_def = f'{node_id}["{label}"]'
+            template = _SHAPE_TEMPLATES.get(node.kind, _DEFAULT_SHAPE_TEMPLATE)
+            node_def = template.format(id=node_id, label=label)
 
         if is_isolated:
             node_def += ":::isolated"
@@ -2,12 +2,58 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
 from datetime import datetime, timedelta, timezone
 
 from justpipe.storage.interface import RunRecord
 from justpipe.types import PipelineTerminalStatus
 
+# Frozen module-level defaults: RunRecord is a frozen dataclass and the event
+# strings are immutable, so every test can share them; overrides go through
+# dataclasses.replace instead of rebuilding from scratch.
+_DEFAULT_RUN = RunRecord(
+    run_id="run1",
+    start_time=datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+    end_time=datetime(2025, 1, 1, 12, 0, 5, tzinfo=timezone.utc),
+    duration=timedelta(seconds=5),
+    status=PipelineTerminalStatus.SUCCESS,
+)
+
+_DEFAULT_EVENTS: tuple[str, ...] = tuple(
+    json.dumps(payload)
+    for payload in (
+        {
+            "type": "start",
+            "stage": "system",
+            "timestamp": 1704110400.0,
+            "node_kind": "system",
+            "attempt": 1,
+        },
+        {
+            "type": "step_start",
+            "stage": "step_a",
+            "timestamp": 1704110400.1,
+            "node_kind": "step",
+            "attempt": 1,
+        },
+        {
+            "type": "step_end",
+            "stage": "step_a",
+            "timestamp": 1704110400.5,
+            "node_kind": "step",
+            "attempt": 1,
+        },
+        {
+            "type": "finish",
+            "stage": "system",
+            "timestamp": 1704110405.0,
+            "node_kind": "system",
+            "attempt": 1,
+        },
+    )
+)
+
 
 def make_run(
     run_id: str = "run1",
@@ -20,15 +66,13 @@ def make_run(
     run_meta: str | None = None,
 ) -> RunRecord:
     """Create a RunRecord with sensible defaults for testing."""
-    _start = start_time or datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    _end = end_time or datetime(2025, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
-    _dur = duration or timedelta(seconds=5)
-    return RunRecord(
+    return dataclasses.replace(
+        _DEFAULT_RUN,
         run_id=run_id,
-        start_time=_start,
-        end_time=_end,
-        duration=_dur,
         status=status,
+        start_time=start_time or _DEFAULT_RUN.start_time,
+        end_time=end_time or _DEFAULT_RUN.end_time,
+        duration=duration or _DEFAULT_RUN.duration,
         error_message=error_message,
         error_step=error_step,
         run_meta=run_meta,
@@ -37,41 +81,4 @@ def make_run(
 
 def make_events() -> list[str]:
     """Create a minimal set of serialized pipeline events for testing."""
-    return [
-        json.dumps(
-            {
-                "type": "start",
-                "stage": "system",
-                "timestamp": 1704110400.0,
-                "node_kind": "system",
-                "attempt": 1,
-            }
-        ),
-        json.dumps(
-            {
-                "type": "step_start",
-                "stage": "step_a",
-                "timestamp": 1704110400.1,
-                "node_kind": "step",
-                "attempt": 1,
-            }
-        ),
-        json.dumps(
-            {
-                "type": "step_end",
-                "stage": "step_a",
-                "timestamp": 1704110400.5,
-                "node_kind": "step",
-                "attempt": 1,
-            }
-        ),
-        json.dumps(
-            {
-                "type": "finish",
-                "stage": "system",
-                "timestamp": 1704110405.0,
-                "node_kind": "system",
-                "attempt": 1,
-            }
-        ),
-    ]
+    return list(_DEFAULT_EVENTS)
@@ -0,0 +1,106 @@
+"""Functional tests for batched TOKEN emission on unbounded queues.
+
+Streaming steps batch tokens onto the event queue when the queue is
+unbounded (queue_size <= 0); the runner expands each batch back into
+individual TOKEN events. Bounded queues keep the per-token path for
+backpressure. These tests pin the public one-event-per-token contract,
+the mid-stream-failure flush, and teardown of an abandoned bounded
+stream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from collections.abc import AsyncGenerator
+
+from justpipe import EventType, Pipe
+
+from tests.functional.helpers import _collect_events
+
+# Must exceed the invoker's internal batch size (16) to force multiple
+# batches plus a partial tail flush.
+TOKEN_COUNT = 40
+
+
+async def _wait_until(predicate: Any, *, timeout: float = 1.0) -> None:
+    """Poll until *predicate()* is truthy, or raise after *timeout*."""
+    deadline = asyncio.get_event_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_event_loop().time() > deadline:
+            raise AssertionError("Timed out waiting for condition")
+        await asyncio.sleep(0.005)
+
+
+async def test_unbounded_queue_streams_one_event_per_token_in_order() -> None:
+    pipe: Pipe[dict[str, Any], None] = Pipe(queue_size=0)
+
+    @pipe.step()
+    async def producer(state: dict[str, Any]) -> AsyncGenerator[str, None]:
+        for i in range(TOKEN_COUNT):
+            yield f"token_{i}"
+
+    events = await _collect_events(pipe, {})
+
+    token_events = [e for e in events if e.type == EventType.TOKEN]
+    assert [e.payload for e in token_events] == [
+        f"token_{i}" for i in range(TOKEN_COUNT)
+    ]
+
+    # Batching is invisible to consumers: tokens stay inside the step's
+    # STEP_START/STEP_END window.
+    types = [e.type for e in events]
+    assert types.index(EventType.STEP_START) < types.index(EventType.TOKEN)
+    last_token = len(types) - 1 - types[::-1].index(EventType.TOKEN)
+    assert last_token < types.index(EventType.STEP_END)
+
+
+async def test_unbounded_queue_flushes_buffered_tokens_on_midstream_error() -> None:
+    pipe: Pipe[dict[str, Any], None] = Pipe(queue_size=0)
+
+    @pipe.step()
+    async def failing_stream(state: dict[str, Any]) -> AsyncGenerator[str, None]:
+        for i in range(5):
+            yield f"token_{i}"
+        raise ValueError("mid-stream failure")
+
+    events = await _collect_events(pipe, {})
+
+    # All five tokens were still buffered (5 < batch size) when the
+    # generator raised; the flush must not lose them.
+    token_events = [e for e in events if e.type == EventType.TOKEN]
+    assert [e.payload for e in token_events] == [f"token_{i}" for i in range(5)]
+
+    errors = [e for e in events if e.type == EventType.STEP_ERROR]
+    assert len(errors) == 1
+    assert "mid-stream failure" in str(errors[0].payload)
+
+
+async def test_abandoned_bounded_stream_cancels_cleanly() -> None:
+    """Regression: a producer blocked on a full bounded queue must terminate
+    when cancelled (as event-loop teardown does), not re-block in the flush."""
+    pipe: Pipe[dict[str, Any], None] = Pipe(queue_size=1)
+    produced: list[int] = []
+
+    @pipe.step()
+    async def producer(state: dict[str, Any]) -> AsyncGenerator[str, None]:
+        for i in range(50):
+            yield f"token_{i}"
+            produced.append(i)
+
+    it = pipe.run({}).__aiter__()
+    await it.__anext__()  # START
+    await it.__anext__()  # STEP_START
+
+    # token_0 fills the queue; once produced == [0] the producer is blocked
+    # trying to put token_1.
+    await _wait_until(lambda: len(produced) >= 1)
+
+    # Abandon the stream and cancel everything it spawned, mirroring
+    # asyncio.run's _cancel_all_tasks during loop teardown.
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    for task in tasks:
+        task.cancel()
+    _, pending = await asyncio.wait(tasks, timeout=5)
+
+    assert not pending, f"tasks survived cancellation: {pending}"
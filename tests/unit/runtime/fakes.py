@@ -108,6 +108,31 @@ class _FakeCoordinatorPort:
         )
 
 
+class _NullOrchestrator:
+    """Inert orchestrator stand-in for tests that never exercise it.
+
+    Unlike MagicMock, attribute access stays a plain lookup instead of
+    spawning child mocks — keep MagicMock only where call assertions are
+    needed.
+    """
+
+
+class _NullFailureHandler:
+    """Inert failure-handler stand-in."""
+
+
+class _NullKernel:
+    """Inert runtime-kernel stand-in."""
+
+
+class _NullMetrics:
+    """Inert metrics-recorder stand-in."""
+
+
+class _NullStepExecution:
+    """Inert step-execution-coordinator stand-in."""
+
+
 class _InvokerSuccess:
     def get_node_kind(self, name: str) -> NodeKind:
         return NodeKind.STEP
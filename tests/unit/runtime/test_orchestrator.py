@@ -1,28 +1,36 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from justpipe._internal.runtime.engine.run_context import _RunContext
 from justpipe._internal.runtime.orchestration.orchestrator import _Orchestrator
 from justpipe._internal.shared.execution_tracker import _ExecutionTracker
+from tests.unit.runtime.fakes import (
+    _NullFailureHandler,
+    _NullKernel,
+    _NullMetrics,
+    _NullStepExecution,
+)
 
 
 def _make_orchestrator() -> _Orchestrator:
     ctx = _RunContext()
-    kernel = MagicMock()
     tracker = _ExecutionTracker()
-    metrics = MagicMock()
-    return _Orchestrator(ctx=ctx, kernel=kernel, tracker=tracker, metrics=metrics)
+    return _Orchestrator(
+        ctx=ctx, kernel=_NullKernel(), tracker=tracker, metrics=_NullMetrics()
+    )
 
 
 def test_wire_called_twice_raises() -> None:
     orch = _make_orchestrator()
-    orch.wire(step_execution=MagicMock(), failure_handler=MagicMock())
+    orch.wire(
+        step_execution=_NullStepExecution(), failure_handler=_NullFailureHandler()
+    )
 
     with pytest.raises(RuntimeError, match="already wired"):
-        orch.wire(step_execution=MagicMock(), failure_handler=MagicMock())
+        orch.wire(
+            step_execution=_NullStepExecution(), failure_handler=_NullFailureHandler()
+        )
 
 
 async def test_fail_step_before_wire_raises() -> None:
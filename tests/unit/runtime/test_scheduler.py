@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 from justpipe._internal.runtime.execution.scheduler import _MapBatch, _Scheduler
+from tests.unit.runtime.fakes import _NullFailureHandler, _NullOrchestrator
 
 
 def _make_scheduler() -> _Scheduler:
     return _Scheduler(
-        orchestrator=MagicMock(),
-        failure_handler=MagicMock(),
+        orchestrator=_NullOrchestrator(),
+        failure_handler=_NullFailureHandler(),
         steps={},
         injection_metadata={},
     )
 
 
+def _seed(scheduler: _Scheduler, *batches: _MapBatch) -> None:
+    for b in batches:
+        scheduler._register_batch("owner", b)
+
+
 def _batch(target: str, item_count: int, remaining: int | None = None) -> _MapBatch:
     return _MapBatch(
         target=target,
@@ -30,7 +34,7 @@ def _batch(target: str, item_count: int, remaining: int | None = None) -> _MapBa
 def test_worker_completion_decrements_remaining():
     scheduler = _make_scheduler()
     b = _batch("worker", item_count=3)
-    scheduler._map_batches["owner"] = [b]
+    _seed(scheduler, b)
 
     scheduler.on_step_completed("owner", "worker")
 
@@ -43,7 +47,7 @@ def test_worker_completion_decrements_remaining():
 def test_batch_completed_when_remaining_reaches_zero():
     scheduler = _make_scheduler()
     b = _batch("worker", item_count=1)
-    scheduler._map_batches["owner"] = [b]
+    _seed(scheduler, b)
 
     completed = scheduler.on_step_completed("owner", "worker")
 
@@ -57,7 +61,7 @@ def test_batch_completed_when_remaining_reaches_zero():
 def test_empty_map_drains_on_owner_completion():
     scheduler = _make_scheduler()
     b = _batch("worker", item_count=0, remaining=0)
-    scheduler._map_batches["owner"] = [b]
+    _seed(scheduler, b)
 
     completed = scheduler.on_step_completed("owner", "owner")
 
@@ -72,13 +76,13 @@ def test_multiple_batches_fifo_order():
     scheduler = _make_scheduler()
     b1 = _batch("worker", item_count=1, remaining=1)
     b2 = _batch("worker", item_count=2, remaining=2)
-    scheduler._map_batches["owner"] = [b1, b2]
+    _seed(scheduler, b1, b2)
 
     # Complete the single worker in b1 -- b1 drains and is removed.
     completed = scheduler.on_step_completed("owner", "worker")
 
     assert completed == [b1]
-    assert scheduler._map_batches["owner"] == [b2]
+    assert list(scheduler._map_batches["owner"]) == [b2]
 
 
 # ---------- 5. Key removed when all batches for owner are drained ----------
@@ -87,7 +91,7 @@ def test_multiple_batches_fifo_order():
 def test_key_removed_when_all_batches_drained():
     scheduler = _make_scheduler()
     b = _batch("worker", item_count=1)
-    scheduler._map_batches["owner"] = [b]
+    _seed(scheduler, b)
 
     scheduler.on_step_completed("owner", "worker")
 
@@ -100,7 +104,7 @@ def test_key_removed_when_all_batches_drained():
 def test_wrong_target_ignored():
     scheduler = _make_scheduler()
     b = _batch("worker", item_count=3)
-    scheduler._map_batches["owner"] = [b]
+    _seed(scheduler, b)
 
     completed = scheduler.on_step_completed("owner", "unrelated_step")
 
@@ -126,7 +130,7 @@ def test_only_oldest_matching_batch_decremented():
     scheduler = _make_scheduler()
     b1 = _batch("worker", item_count=2, remaining=2)
     b2 = _batch("worker", item_count=3, remaining=3)
-    scheduler._map_batches["owner"] = [b1, b2]
+    _seed(scheduler, b1, b2)
 
     scheduler.on_step_completed("owner", "worker")
 
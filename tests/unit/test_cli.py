@@ -1,19 +1,24 @@
 """CLI smoke tests."""
 
+import pytest
 from click.testing import CliRunner
 
 from justpipe.cli.main import cli
 
 
-def test_cli_help_smoke() -> None:
-    runner = CliRunner()
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """One stateless CliRunner shared across the module's invocations."""
+    return CliRunner()
+
+
+def test_cli_help_smoke(runner: CliRunner) -> None:
     result = runner.invoke(cli, ["--help"])
     assert result.exit_code == 0
     assert "justpipe" in result.output.lower()
 
 
-def test_cli_pipelines_help() -> None:
-    runner = CliRunner()
+def test_cli_pipelines_help(runner: CliRunner) -> None:
     result = runner.invoke(cli, ["pipelines", "--help"])
     assert result.exit_code == 0
     assert "pipeline" in result.output.lower()
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import dataclasses
+from typing import Any
+from collections.abc import Callable
 
 import pytest
 
@@ -15,6 +17,37 @@ from justpipe.failures import (
 )
 
 
+def _make_context() -> FailureClassificationContext:
+    return FailureClassificationContext(
+        error=None,
+        kind=FailureKind.VALIDATION,
+        reason=FailureReason.VALIDATION_ERROR,
+        step=None,
+        default_source=FailureSource.USER_CODE,
+    )
+
+
+@pytest.mark.parametrize(
+    ("make", "field", "value"),
+    [
+        pytest.param(_make_context, "step", "changed", id="context"),
+        pytest.param(
+            FailureClassificationConfig,
+            "source_classifier",
+            lambda ctx: None,
+            id="config",
+        ),
+    ],
+)
+def test_frozen_contract(make: Callable[[], Any], field: str, value: Any) -> None:
+    """Writes to the frozen classification dataclasses are rejected."""
+    obj = make()
+    # slots=True raises AttributeError from the slot descriptor in some
+    # interpreter paths; frozen dataclasses raise FrozenInstanceError.
+    with pytest.raises((dataclasses.FrozenInstanceError, AttributeError)):
+        setattr(obj, field, value)
+
+
 class TestFailureClassificationContext:
     def test_construction_with_all_fields(self) -> None:
         err = ValueError("boom")
@@ -42,17 +75,6 @@ class TestFailureClassificationContext:
         assert ctx.error is None
         assert ctx.step is None
 
-    def test_frozen_immutability(self) -> None:
-        ctx = FailureClassificationContext(
-            error=None,
-            kind=FailureKind.VALIDATION,
-            reason=FailureReason.VALIDATION_ERROR,
-            step=None,
-            default_source=FailureSource.USER_CODE,
-        )
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            ctx.step = "changed"  # type: ignore[misc]
-
 
 class TestFailureClassificationConfig:
     def test_default_values(self) -> None:
@@ -73,11 +95,6 @@ class TestFailureClassificationConfig:
         )
         assert cfg.external_dependency_prefixes == ("httpx.", "boto3.")
 
-    def test_frozen_immutability(self) -> None:
-        cfg = FailureClassificationConfig()
-        with pytest.raises(dataclasses.FrozenInstanceError):
-            cfg.source_classifier = lambda ctx: None  # type: ignore[misc]
-
 
 class TestFailureSourceClassifier:
     def test_callable_as_classifier(self) -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from justpipe._internal.runtime.telemetry.execution_log import _ExecutionLog
 from justpipe._internal.runtime.telemetry.failure_journal import _FailureJournal
 from justpipe.types import (
@@ -22,6 +24,12 @@ class FakeExternalError(Exception):
 FakeExternalError.__module__ = "httpx.errors"
 
 
+@pytest.fixture(scope="module")
+def default_journal() -> _FailureJournal:
+    """Shared default-config journal for read-only classification tests."""
+    return _FailureJournal()
+
+
 class TestFailureJournalInit:
     def test_default_config_uses_default_prefixes(self) -> None:
         journal = _FailureJournal()
@@ -29,6 +37,11 @@ class TestFailureJournalInit:
         assert "requests" in journal._external_dep_prefixes
         assert "openai" in journal._external_dep_prefixes
         assert "asyncpg" in journal._external_dep_prefixes
+        # Default-config journals share the module-level tuple.
+        assert (
+            journal._external_dep_prefixes
+            is _FailureJournal._DEFAULT_EXTERNAL_DEP_PREFIXES
+        )
 
     def test_custom_config_merges_prefixes_with_defaults(self) -> None:
         cfg = FailureClassificationConfig(
@@ -44,25 +57,54 @@ class TestFailureJournalInit:
 
 
 class TestBuiltinClassification:
-    def test_external_dep_module_prefix_returns_external_dep(self) -> None:
-        journal = _FailureJournal()
+    def test_external_dep_module_prefix_returns_external_dep(
+        self, default_journal: _FailureJournal
+    ) -> None:
         err = FakeExternalError("connection refused")
-        result = journal._classify_failure_source_builtin(err, FailureSource.USER_CODE)
+        result = default_journal._classify_failure_source_builtin(
+            err, FailureSource.USER_CODE
+        )
         assert result is FailureSource.EXTERNAL_DEP
 
-    def test_none_error_returns_default_source(self) -> None:
-        journal = _FailureJournal()
-        result = journal._classify_failure_source_builtin(None, FailureSource.FRAMEWORK)
+    def test_none_error_returns_default_source(
+        self, default_journal: _FailureJournal
+    ) -> None:
+        result = default_journal._classify_failure_source_builtin(
+            None, FailureSource.FRAMEWORK
+        )
         assert result is FailureSource.FRAMEWORK
 
-    def test_builtin_error_returns_default_source(self) -> None:
-        journal = _FailureJournal()
+    def test_builtin_error_returns_default_source(
+        self, default_journal: _FailureJournal
+    ) -> None:
         err = ValueError("bad value")
-        result = journal._classify_failure_source_builtin(err, FailureSource.USER_CODE)
+        result = default_journal._classify_failure_source_builtin(
+            err, FailureSource.USER_CODE
+        )
         assert result is FailureSource.USER_CODE
 
 
 class TestUserClassifier:
+    def test_no_context_built_without_classifier(
+        self, monkeypatch: pytest.MonkeyPatch, default_journal: _FailureJournal
+    ) -> None:
+        """The default-config path must not allocate a classification context."""
+        from justpipe._internal.runtime.telemetry import failure_journal as fj
+
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("context should not be built without a classifier")
+
+        monkeypatch.setattr(fj, "FailureClassificationContext", _fail)
+        source, diagnostic = default_journal._resolve_failure_source(
+            error=ValueError("boom"),
+            kind=FailureKind.STEP,
+            reason=FailureReason.STEP_ERROR,
+            step="my_step",
+            default=FailureSource.USER_CODE,
+        )
+        assert source is FailureSource.USER_CODE
+        assert diagnostic is None
+
     def test_classifier_returns_valid_source_overrides_default(self) -> None:
         def classifier(ctx: FailureClassificationContext) -> FailureSource | None:
             return FailureSource.EXTERNAL_DEP
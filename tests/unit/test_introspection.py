@@ -30,7 +30,7 @@ def test_steps_basic() -> None:
     assert first_info.name == "first"
     assert first_info.timeout == 5.0
     assert first_info.retries == 2
-    assert first_info.targets == ["second"]
+    assert first_info.targets == ("second",)
     assert first_info.kind == NodeKind.STEP
     assert first_info.has_error_handler is False
 
@@ -38,7 +38,7 @@ def test_steps_basic() -> None:
     assert second_info.name == "second"
     assert second_info.timeout is None
     assert second_info.retries == 0
-    assert second_info.targets == []
+    assert second_info.targets == ()
     assert second_info.kind == NodeKind.STEP
 
 
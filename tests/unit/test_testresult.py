@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from justpipe.testing import TestResult
 from justpipe.types import Event, EventType
 
@@ -9,122 +11,113 @@ def _ev(event_type: EventType, stage: str, payload: object = None) -> Event:
     return Event(type=event_type, stage=stage, payload=payload)
 
 
-# -- filter() ----------------------------------------------------------------
-
-
-def test_filter_returns_matching_events():
+# One representative trace shared by every read-only accessor test below;
+# TestResult never mutates its events, so the fixture is safe to reuse.
+_FULL_EVENTS = [
+    _ev(EventType.START, "pipeline"),
+    _ev(EventType.STEP_START, "load"),
+    _ev(EventType.STEP_END, "load", payload={"x": 1}),
+    _ev(EventType.STEP_START, "transform"),
+    _ev(EventType.STEP_END, "transform"),
+    _ev(EventType.STEP_START, "stream"),
+    _ev(EventType.TOKEN, "stream", payload="chunk1"),
+    _ev(EventType.TOKEN, "stream", payload="chunk2"),
+    _ev(EventType.TOKEN, "stream", payload="chunk3"),
+    _ev(EventType.STEP_END, "stream"),
+    _ev(EventType.STEP_START, "fetch"),
+    _ev(EventType.STEP_END, "fetch"),
+    _ev(EventType.STEP_START, "a"),
+    _ev(EventType.STEP_ERROR, "a", payload=ValueError("boom")),
+    _ev(EventType.STEP_START, "b"),
+    _ev(EventType.STEP_ERROR, "b", payload=RuntimeError("crash")),
+    _ev(EventType.FINISH, "pipeline"),
+]
+
+
+@pytest.fixture(scope="module")
+def full_result() -> TestResult[dict]:
+    return TestResult(events=list(_FULL_EVENTS), final_state={})
+
+
+@pytest.fixture(scope="module")
+def quiet_result() -> TestResult[dict]:
+    """Trace with no tokens, errors, or step starts beyond lifecycle events."""
     events = [
-        _ev(EventType.STEP_START, "a"),
-        _ev(EventType.STEP_END, "a", payload={"x": 1}),
-        _ev(EventType.STEP_START, "b"),
+        _ev(EventType.START, "pipeline"),
+        _ev(EventType.FINISH, "pipeline"),
     ]
-    result = TestResult(events=events, final_state={})
+    return TestResult(events=events, final_state={})
 
-    filtered = result.filter(EventType.STEP_START)
 
-    assert len(filtered) == 2
-    assert all(e.type == EventType.STEP_START for e in filtered)
-    assert [e.stage for e in filtered] == ["a", "b"]
+# -- filter() ----------------------------------------------------------------
 
 
-def test_filter_returns_empty_list_when_no_matches():
-    events = [
-        _ev(EventType.STEP_START, "a"),
-        _ev(EventType.STEP_END, "a"),
+def test_filter_returns_matching_events(full_result: TestResult[dict]) -> None:
+    filtered = full_result.filter(EventType.STEP_START)
+
+    assert len(filtered) == 6
+    assert all(e.type == EventType.STEP_START for e in filtered)
+    assert [e.stage for e in filtered] == [
+        "load",
+        "transform",
+        "stream",
+        "fetch",
+        "a",
+        "b",
     ]
-    result = TestResult(events=events, final_state={})
 
-    assert result.filter(EventType.TOKEN) == []
+
+def test_filter_returns_empty_list_when_no_matches(
+    quiet_result: TestResult[dict],
+) -> None:
+    assert quiet_result.filter(EventType.TOKEN) == []
 
 
 # -- step_starts -------------------------------------------------------------
 
 
-def test_step_starts_returns_stage_names():
-    events = [
-        _ev(EventType.START, "pipeline"),
-        _ev(EventType.STEP_START, "load"),
-        _ev(EventType.STEP_END, "load"),
-        _ev(EventType.STEP_START, "transform"),
-        _ev(EventType.STEP_END, "transform"),
-        _ev(EventType.FINISH, "pipeline"),
-    ]
-    result = TestResult(events=events, final_state={})
+def test_step_starts_returns_stage_names(full_result: TestResult[dict]) -> None:
+    assert full_result.step_starts == ["load", "transform", "stream", "fetch", "a", "b"]
 
-    assert result.step_starts == ["load", "transform"]
 
-
-def test_step_starts_returns_empty_list_when_no_step_starts():
-    events = [
-        _ev(EventType.START, "pipeline"),
-        _ev(EventType.FINISH, "pipeline"),
-    ]
-    result = TestResult(events=events, final_state={})
-
-    assert result.step_starts == []
+def test_step_starts_returns_empty_list_when_no_step_starts(
+    quiet_result: TestResult[dict],
+) -> None:
+    assert quiet_result.step_starts == []
 
 
 # -- tokens -------------------------------------------------------------------
 
 
-def test_tokens_returns_payloads():
-    events = [
-        _ev(EventType.STEP_START, "stream"),
-        _ev(EventType.TOKEN, "stream", payload="chunk1"),
-        _ev(EventType.TOKEN, "stream", payload="chunk2"),
-        _ev(EventType.TOKEN, "stream", payload="chunk3"),
-        _ev(EventType.STEP_END, "stream"),
-    ]
-    result = TestResult(events=events, final_state={})
+def test_tokens_returns_payloads(full_result: TestResult[dict]) -> None:
+    assert full_result.tokens == ["chunk1", "chunk2", "chunk3"]
 
-    assert result.tokens == ["chunk1", "chunk2", "chunk3"]
-
-
-def test_tokens_returns_empty_list_when_no_tokens():
-    events = [
-        _ev(EventType.STEP_START, "a"),
-        _ev(EventType.STEP_END, "a"),
-    ]
-    result = TestResult(events=events, final_state={})
 
-    assert result.tokens == []
+def test_tokens_returns_empty_list_when_no_tokens(
+    quiet_result: TestResult[dict],
+) -> None:
+    assert quiet_result.tokens == []
 
 
 # -- was_called() -------------------------------------------------------------
 
 
-def test_was_called_returns_true_and_false():
-    events = [
-        _ev(EventType.STEP_START, "fetch"),
-        _ev(EventType.STEP_END, "fetch"),
-    ]
-    result = TestResult(events=events, final_state={})
-
-    assert result.was_called("fetch") is True
-    assert result.was_called("missing_step") is False
+def test_was_called_returns_true_and_false(full_result: TestResult[dict]) -> None:
+    assert full_result.was_called("fetch") is True
+    assert full_result.was_called("missing_step") is False
 
 
 # -- find_error() -------------------------------------------------------------
 
 
-def test_find_error_no_stage_returns_first_error():
-    events = [
-        _ev(EventType.STEP_START, "a"),
-        _ev(EventType.STEP_ERROR, "a", payload=ValueError("boom")),
-        _ev(EventType.STEP_START, "b"),
-        _ev(EventType.STEP_ERROR, "b", payload=RuntimeError("crash")),
-    ]
-    result = TestResult(events=events, final_state={})
+def test_find_error_no_stage_returns_first_error(
+    full_result: TestResult[dict],
+) -> None:
+    assert full_result.find_error() == "boom"
 
-    assert result.find_error() == "boom"
-
-
-def test_find_error_with_stage_returns_matching_error_or_none():
-    events = [
-        _ev(EventType.STEP_ERROR, "a", payload=ValueError("first")),
-        _ev(EventType.STEP_ERROR, "b", payload=RuntimeError("second")),
-    ]
-    result = TestResult(events=events, final_state={})
 
-    assert result.find_error(stage="b") == "second"
-    assert result.find_error(stage="nonexistent") is None
+def test_find_error_with_stage_returns_matching_error_or_none(
+    full_result: TestResult[dict],
+) -> None:
+    assert full_result.find_error(stage="b") == "crash"
+    assert full_result.find_error(stage="nonexistent") is None
@@ -1,6 +1,9 @@
 """Unit tests for _MermaidRenderer and MermaidTheme."""
 
 from typing import Any
+
+import pytest
+
 from justpipe.visualization import (
     _MermaidRenderer,
     MermaidTheme,
@@ -26,52 +29,49 @@ def create_ast(
     )
 
 
-def test_mermaid_renderer_empty() -> None:
-    ast = _PipelineASTBuilder.build({}, {})
-    renderer = _MermaidRenderer(ast)
-    output = renderer.render()
-    assert "graph TD" in output
-    assert "Empty[No steps registered]" in output
-
-
-def test_mermaid_renderer_simple() -> None:
-    """Test rendering simple AST."""
-    node = VisualNode(id="n0", name="step", kind=VisualNodeKind.STEP)
-    ast = create_ast(nodes={"step": node})
-    renderer = _MermaidRenderer(ast)
-    output = renderer.render()
-    assert 'n0["Step"]' in output
-    assert "class n0 step;" in output
+@pytest.fixture(scope="module")
+def empty_ast() -> VisualAST:
+    """The shared empty AST; built once per process by the builder cache."""
+    return _PipelineASTBuilder.empty()
 
 
-def test_mermaid_renderer_streaming_shape() -> None:
-    """Test streaming node shape."""
-    node = VisualNode(id="n0", name="stream", kind=VisualNodeKind.STREAMING)
-    ast = create_ast(nodes={"stream": node})
-    renderer = _MermaidRenderer(ast)
-    output = renderer.render()
-    assert 'n0(["Stream ⚡"])' in output
-    assert "class n0 streaming;" in output
+@pytest.fixture
+def renderer(empty_ast: VisualAST) -> _MermaidRenderer:
+    """Fresh renderer over the shared empty AST for internal-method tests."""
+    return _MermaidRenderer(empty_ast, MermaidTheme())
 
 
-def test_mermaid_renderer_map_shape() -> None:
-    """Test map node shape."""
-    node = VisualNode(id="n0", name="mapper", kind=VisualNodeKind.MAP)
-    ast = create_ast(nodes={"mapper": node})
-    renderer = _MermaidRenderer(ast)
+def test_mermaid_renderer_empty(empty_ast: VisualAST) -> None:
+    renderer = _MermaidRenderer(empty_ast)
     output = renderer.render()
-    assert 'n0[["Mapper"]]' in output
-    assert "class n0 map;" in output
+    assert "graph TD" in output
+    assert "Empty[No steps registered]" in output
 
 
-def test_mermaid_renderer_switch_shape() -> None:
-    """Test switch node shape."""
-    node = VisualNode(id="n0", name="router", kind=VisualNodeKind.SWITCH)
-    ast = create_ast(nodes={"router": node})
+@pytest.mark.parametrize(
+    ("kind", "name", "shape", "cls"),
+    [
+        (VisualNodeKind.STEP, "step", 'n0["Step"]', "class n0 step;"),
+        (
+            VisualNodeKind.STREAMING,
+            "stream",
+            'n0(["Stream ⚡"])',
+            "class n0 streaming;",
+        ),
+        (VisualNodeKind.MAP, "mapper", 'n0[["Mapper"]]', "class n0 map;"),
+        (VisualNodeKind.SWITCH, "router", 'n0{"Router"}', "class n0 switch;"),
+    ],
+)
+def test_mermaid_renderer_node_shapes(
+    kind: VisualNodeKind, name: str, shape: str, cls: str
+) -> None:
+    """Each node kind renders its mermaid shape and class."""
+    node = VisualNode(id="n0", name=name, kind=kind)
+    ast = create_ast(nodes={name: node})
     renderer = _MermaidRenderer(ast)
     output = renderer.render()
-    assert 'n0{"Router"}' in output
-    assert "class n0 switch;" in output
+    assert shape in output
+    assert cls in output
 
 
 def test_mermaid_renderer_map_edge() -> None:
@@ -110,11 +110,8 @@ def test_mermaid_theme_custom_colors() -> None:
     assert any("fill:#ff0000" in s and "classDef step" in s for s in styles)
 
 
-def test_renderer_internal_methods() -> None:
+def test_renderer_internal_methods(renderer: _MermaidRenderer) -> None:
     """Test internal helper methods of _MermaidRenderer."""
-    # Build an empty AST
-    ast = _PipelineASTBuilder.build({}, {})
-    renderer = _MermaidRenderer(ast, MermaidTheme())
 
     # Test _add indentation
     renderer._add("test", indent=2)
@@ -124,6 +121,10 @@ def test_renderer_internal_methods() -> None:
     assert renderer._format_label("simple_name") == "Simple Name"
     # Note: .title() affects the escaped quote
     assert renderer._format_label('quote"test"') == "Quote&Quot;Test&Quot;"
+    # Repeated labels come from the cache
+    assert renderer._format_label("simple_name") is renderer._format_label(
+        "simple_name"
+    )
 
 
 def test_theme_methods() -> None:
@@ -138,10 +139,8 @@ def test_theme_methods() -> None:
     assert any("fill:#ffffff" in s for s in styles)
 
 
-def test_node_formatting() -> None:
+def test_node_formatting(renderer: _MermaidRenderer) -> None:
     """Test complex node formatting scenarios."""
-    ast = _PipelineASTBuilder.build({}, {})
-    renderer = _MermaidRenderer(ast)
 
     # Test node with isolated status
     node = VisualNode(id="n1", name="test", kind=VisualNodeKind.STEP, is_isolated=True)